@@ -0,0 +1,186 @@
+"""
+Rex Research 발명품 크롤러 - 명령행 인자 정의 (main.py / run_crawler.py 공용)
+"""
+
+import argparse
+import os
+import sys
+
+def configure_console():
+    """콘솔 출력을 UTF-8로 설정 (Windows 유니코드 호환, 인코딩 불가 문자는 대체)"""
+    if sys.platform == "win32":
+        # 콘솔 코드페이지를 UTF-8(65001)로 설정 - chcp 프로세스 실행 없이 직접 호출
+        import ctypes
+        ctypes.windll.kernel32.SetConsoleOutputCP(65001)
+        ctypes.windll.kernel32.SetConsoleCP(65001)
+        
+        sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+        sys.stderr.reconfigure(encoding='utf-8', errors='replace')
+
+def positive_float(value: str) -> float:
+    """0보다 큰 실수만 허용하는 argparse 타입"""
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"실수가 아닙니다: {value}")
+    if not number > 0:
+        raise argparse.ArgumentTypeError(f"0보다 커야 합니다: {value}")
+    return number
+
+def positive_int(value: str) -> int:
+    """1 이상의 정수만 허용하는 argparse 타입"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"정수가 아닙니다: {value}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"1 이상이어야 합니다: {value}")
+    return number
+
+def build_parser() -> argparse.ArgumentParser:
+    """크롤러 명령행 인자 파서 생성"""
+    parser = argparse.ArgumentParser(
+        description='Rex Research 발명품 크롤러 - 각 발명품별 개별 LLM 학습용 파일 생성',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+🎯 목적: 각 발명품 링크별로 원리와 설명을 포함한 개별 파일 생성
+
+사용 예시:
+  python main.py                           # 기본 설정으로 50개 발명품 크롤링
+  python main.py -n 20                     # 20개 발명품만 크롤링
+  python main.py -d 2 5                    # 2-5초 지연으로 크롤링
+  python main.py -c 8                      # 동시 요청 8개로 크롤링
+  python main.py -j                        # CPU 코어 수만큼 프로세스로 병렬 파싱
+  python main.py -r 2                      # 초당 최대 2개 요청으로 제한
+  python main.py -o inventions_data        # 출력 디렉토리명 지정
+  python main.py --verbose                 # 상세 로그 출력
+  python main.py --test                    # 처음 5개만 테스트
+  python main.py --category energy         # 특정 카테고리만 크롤링
+  python main.py --archive                 # 하나의 tar.gz 아카이브로 저장
+  python main.py --cache                   # 페이지를 디스크에 캐시 (재실행 시 재다운로드 없음)
+        """
+    )
+    
+    parser.add_argument(
+        '-n', '--max-pages',
+        type=int,
+        default=0,
+        help='크롤링할 최대 발명품 수 (기본값: 0=전체, 테스트용으로 50 등 지정 가능)'
+    )
+    
+    parser.add_argument(
+        '-d', '--delay',
+        nargs=2,
+        type=float,
+        default=[1.0, 3.0],
+        metavar=('MIN', 'MAX'),
+        help='요청 간 지연 시간 범위 (초), 평균값으로 요청 속도 제한 (기본값: 1.0 3.0)'
+    )
+    
+    parser.add_argument(
+        '-c', '--concurrency',
+        type=positive_int,
+        default=32,
+        help='동시 요청 수 (기본값: 32)'
+    )
+    
+    parser.add_argument(
+        '-r', '--rate',
+        type=positive_float,
+        default=None,
+        help='초당 최대 요청 수 (기본값: 1 / 평균 지연, 기본 지연이면 0.5)'
+    )
+    
+    parser.add_argument(
+        '-o', '--output-dir',
+        type=str,
+        default='rex_inventions',
+        help='출력 디렉토리명 (기본값: rex_inventions)'
+    )
+    
+    parser.add_argument(
+        '--url',
+        type=str,
+        default='https://www.rexresearch.com/invnindx.html',
+        help='크롤링할 기본 URL'
+    )
+    
+    parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='상세 로그 출력'
+    )
+    
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='실제 크롤링 없이 링크만 확인'
+    )
+    
+    parser.add_argument(
+        '--test',
+        action='store_true',
+        help='테스트 모드 (처음 5개만 크롤링)'
+    )
+    
+    parser.add_argument(
+        '--category',
+        type=str,
+        choices=['energy', 'medical', 'transport', 'general'],
+        help='특정 카테고리만 크롤링'
+    )
+    
+    parser.add_argument(
+        '--max-content-chars',
+        type=int,
+        default=0,
+        metavar='N',
+        help='발명품당 저장할 본문 최대 글자 수 (기본값: 0=제한 없음)'
+    )
+    
+    parser.add_argument(
+        '-j', '--parse-workers',
+        type=int,
+        nargs='?',
+        const=os.cpu_count() or 1,
+        default=0,
+        metavar='N',
+        help='HTML 파싱 전용 프로세스 수 (값 없이 지정 시 CPU 코어 수, 기본값: 0=스레드에서 파싱)'
+    )
+    
+    parser.add_argument(
+        '--archive',
+        action='store_true',
+        help='개별 .txt 파일 대신 하나의 tar.gz 아카이브로 저장'
+    )
+    
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='이미 저장된 발명품(completed.jsonl 기록 또는 출력 .txt 파일 존재)은 건너뛰고 계속'
+    )
+    
+    parser.add_argument(
+        '--cache',
+        nargs='?',
+        const='rex_cache',
+        default=None,
+        metavar='DIR',
+        help='가져온 페이지를 디스크에 7일간 캐시, 이후에는 ETag/Last-Modified로 재검증 (기본 디렉토리: rex_cache)'
+    )
+    
+    return parser
+
+def apply_args(crawler, args):
+    """파싱된 인자를 크롤러 설정에 반영"""
+    crawler.request_delay = tuple(args.delay)
+    crawler.concurrency = args.concurrency
+    crawler.rate_limit = args.rate
+    crawler.output_dir = args.output_dir
+    crawler.max_content_chars = args.max_content_chars
+    crawler.parse_workers = args.parse_workers
+    crawler.archive = args.archive
+    crawler.cache_dir = args.cache
+    if args.resume:
+        crawler.completed_urls = crawler.load_completed_urls()
+        crawler.skip_existing = True
@@ -1,73 +1,328 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import aiohttp
+import asyncio
+from bs4 import BeautifulSoup, SoupStrainer, NavigableString, CData
 import time
 import re
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin, urlparse, urlsplit, urlunsplit
 import json
 import os
 from datetime import datetime
 import logging
-from typing import Dict, List, Optional
-import random
+from typing import Callable, Dict, List, Optional, Tuple
+from functools import lru_cache
+from contextlib import nullcontext
+from types import MappingProxyType
+import importlib.util
+import queue
+import threading
+import io
+import tarfile
+import hashlib
+import tempfile
+from html import unescape
+import sys
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 
-def safe_print(message_with_emoji, message_plain=""):
-    """안전한 출력 (Windows 유니코드 호환)"""
-    try:
-        print(message_with_emoji)
-    except UnicodeEncodeError:
-        print(message_plain if message_plain else message_with_emoji.encode('ascii', 'ignore').decode('ascii'))
+try:
+    import orjson
+except ImportError:  # 선택 패키지: 없으면 표준 json 사용
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:  # 선택 패키지: 없으면 hashlib.blake2b 사용
+    xxhash = None
+
+# 모든 요청에 공유하는 불변 헤더 (세션 생성 시 한 번만 복사)
+# brotli 디코더가 설치된 경우에만 br 압축을 요청
+_BROTLI_AVAILABLE = any(importlib.util.find_spec(m) is not None for m in ('brotli', 'brotlicffi'))
+DEFAULT_HEADERS = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept-Encoding': 'gzip, deflate, br' if _BROTLI_AVAILABLE else 'gzip, deflate',
+})
+
+# 일시적 오류로 보고 재시도하는 HTTP 상태 코드 (그 외 4xx는 즉시 실패 처리)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# 특허 번호 패턴 (모듈 로드 시 한 번만 컴파일)
+# "Patent 4,123,456", "US Patent No. 4,123,456", "U.S. Patent ...", "Patent # ...", "Pat. No. ..."
+# 형식을 하나의 alternation으로 합쳐 본문을 한 번만 스캔
+_PATENT_RE = re.compile(
+    r'(?:Patent\s+(?:No\.?\s*|#\s*)?|Pat\.\s*No\.\s*)(\d{1,2}[,.\s]?\d{3}[,.\s]?\d{3})',
+    re.IGNORECASE
+)
+_PATENT_SEPARATOR_RE = re.compile(r'[,.\s]')
+
+# 기술적 원리 설명 문단을 찾는 키워드 (복수형 포함 단어 단위로만 매칭, 예: "network"는 "working"이 아님)
+_PRINCIPLE_RE = re.compile(
+    r'\b(?:(?:principle|mechanism|operation|function|method|technique)s?'
+    r'|theor(?:y|ies)|(?:process|approach)(?:es)?|workings?)\b',
+    re.IGNORECASE
+)
+
+# 인덱스 페이지에서는 링크(<a href>)만 필요하므로 나머지 태그는 생성하지 않음
+INDEX_STRAINER = SoupStrainer('a', href=True)
+
+# 발명품 링크가 아닌 href/링크 텍스트 제외 패턴
+_EXCLUDE_HREF_RE = re.compile(
+    r'javascript:|mailto:|#|https?://|(?:index|home|about|contact|search|links|disclaimer)\.html',
+    re.IGNORECASE
+)
+# 텍스트는 단어 단위로 비교 ('Christopher'의 'top' 같은 부분 일치로 제외되지 않도록)
+_EXCLUDE_TEXT_RE = re.compile(
+    r'\b(?:home|back|top|index|search|contact|about|links|disclaimer|rexresearch)\b',
+    re.IGNORECASE
+)
+
+# 링크 카테고리 / 이미지 타입 키워드 (기존과 같이 부분 문자열 일치, 대소문자 무시)
+_ENERGY_RE = re.compile(r'energy|power|electric|magnetic|battery|fuel|solar|generator', re.IGNORECASE)
+_MEDICAL_RE = re.compile(r'medical|health|therapy|healing|cure|treatment', re.IGNORECASE)
+_TRANSPORT_RE = re.compile(r'car|vehicle|engine|motor|aviation|aircraft', re.IGNORECASE)
+_DIAGRAM_RE = re.compile(r'diagram|schematic|circuit|blueprint|plan|design', re.IGNORECASE)
+_PHOTO_RE = re.compile(r'photo|picture|image', re.IGNORECASE)
+
+# URL 경로의 연속 슬래시
+_DUP_SLASH_RE = re.compile(r'/{2,}')
+
+# 문자열 연결만으로 urljoin과 같은 결과가 나오는 단순한 URL/링크
+# (빈 경로 조각(//), ./ ../ 조각, 공백/제어 문자, ; ? # 등이 있으면 urljoin에 맡김)
+_PLAIN_SEGMENT = r'(?!\.\.?(?:/|$))[A-Za-z0-9_.~%+\-]+'
+_PLAIN_PATH = rf'(?:{_PLAIN_SEGMENT}/)*(?:{_PLAIN_SEGMENT})?'
+_PLAIN_ORIGIN = r'https?://[A-Za-z0-9.\-]+(?::\d+)?'
+_PLAIN_BASE_RE = re.compile(rf'{_PLAIN_ORIGIN}(?:/{_PLAIN_PATH})?')
+_PLAIN_HREF_RE = re.compile(rf'(?:{_PLAIN_ORIGIN})?/?{_PLAIN_PATH}')
+
+# 섹션 구분에 쓰는 헤딩 태그
+_HEADING_TAGS = frozenset({'h1', 'h2', 'h3', 'h4', 'h5', 'h6'})
+
+# 공백 정리 및 파일명 정리용 패턴
+_WS_RE = re.compile(r'\s+')
+_FILENAME_UNSAFE_RE = re.compile(r'[^\w\s-]')
+_FILENAME_SEPARATOR_RE = re.compile(r'[-\s]+')
+
+def canonical_url(url: str) -> str:
+    """중복 판별용 정규화 URL (scheme/host 소문자, 연속/끝 슬래시 정리, fragment 제거)"""
+    parts = urlsplit(url)
+    path = _DUP_SLASH_RE.sub('/', parts.path).rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, parts.query, ''))
+
+def url_key(url: str) -> int:
+    """정규화 URL의 128비트 해시 (방문/완료 집합에 문자열 대신 저장)"""
+    data = canonical_url(url).encode('utf-8')
+    if xxhash is not None:
+        return xxhash.xxh3_128_intdigest(data)
+    return int.from_bytes(hashlib.blake2b(data, digest_size=16).digest(), 'big')
+
+@lru_cache(maxsize=4096)
+def join_url(base: str, href: str) -> str:
+    """urljoin(base, href)와 같은 결과 - 흔한 형태의 링크는 URL 파싱 없이 문자열 연결로 처리"""
+    # 단순한 형태가 아니면(_PLAIN_BASE_RE/_PLAIN_HREF_RE) urljoin에 맡김
+    if not href or not _PLAIN_HREF_RE.fullmatch(href) or not _PLAIN_BASE_RE.fullmatch(base):
+        return urljoin(base, href)
+    if href.startswith(('http://', 'https://')):
+        return href if href.find('/', 8) != -1 else urljoin(base, href)
+    
+    host_end = base.find('/', base.find('//') + 2)
+    if href.startswith('/'):
+        return (base if host_end == -1 else base[:host_end]) + href
+    if host_end == -1:
+        return base + '/' + href
+    return base[:base.rfind('/') + 1] + href
+
+def intern_text(text: str, max_length: int = 128) -> str:
+    """짧은 문자열은 intern하여 여러 페이지에 반복되는 메뉴/로고 텍스트를 한 객체로 공유"""
+    return sys.intern(text) if len(text) < max_length else text
+
+def dumps_json(data) -> str:
+    """JSON 직렬화 (orjson이 있으면 사용, 들여쓰기 2칸, 유니코드 그대로)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+def dumps_json_line(data) -> str:
+    """한 줄짜리 JSON 직렬화 (JSONL 기록용, orjson이 있으면 사용)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+def loads_json(line: str):
+    """JSON 역직렬화 (orjson이 있으면 사용)"""
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+class BufferedFileHandler(logging.FileHandler):
+    """큰 버퍼로 로그 파일을 쓰고 일정 레코드마다만 디스크로 flush하는 핸들러"""
+    
+    def __init__(self, filename: str, encoding: str = 'utf-8', buffer_size: int = 524288, flush_every: int = 100):
+        self.buffer_size = buffer_size
+        self.flush_every = flush_every
+        self._pending = 0
+        super().__init__(filename, encoding=encoding)
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+    
+    def emit(self, record):
+        super().emit(record)
+        # 오류는 즉시 기록되도록 바로 flush
+        if record.levelno >= logging.ERROR:
+            self.force_flush()
+    
+    def flush(self):
+        # StreamHandler.emit이 레코드마다 호출하므로 N개마다만 실제 flush
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self.force_flush()
+    
+    def force_flush(self):
+        self._pending = 0
+        super().flush()
+
+class AsyncRateLimiter:
+    """토큰 버킷 방식 요청 속도 제한 (초당 rate개, burst개까지는 대기 없이 연속 허용)"""
+    
+    def __init__(self, rate: float, burst: float = 1.0):
+        if not rate > 0:
+            raise ValueError(f"rate는 0보다 커야 합니다: {rate}")
+        self.rate = rate
+        self.capacity = max(1.0, burst)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                # 토큰 하나가 찰 때까지만 대기
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+    
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        return False
 
 class RexResearchCrawler:
-    def __init__(self, base_url: str = "https://www.rexresearch.com/invnindx.html"):
+    # 개별 발명품 페이지에서 처리할 태그 수 상한 (링크가 매우 많은 페이지 대비)
+    MAX_LINKS_PER_PAGE = 500
+    MAX_IMAGES_PER_PAGE = 200
+    MAX_HEADINGS_PER_PAGE = 200
+    
+    def __init__(self, base_url: str = "https://www.rexresearch.com/invnindx.html", parse_only: bool = False):
+        """parse_only=True이면 파싱 전용 인스턴스 (HTTP 세션과 로그 파일 설정을 만들지 않음, 파싱 워커용)"""
         self.base_url = base_url
         self.base_domain = "https://www.rexresearch.com"
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
-        
-        # 로깅 설정 (Windows 유니코드 호환)
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('rex_research_crawler.log', encoding='utf-8'),
-                logging.StreamHandler()
-            ]
-        )
+        self.session = None
+        
+        if not parse_only:
+            self.session = requests.Session()
+            self.session.headers.update(DEFAULT_HEADERS)
+            
+            # 같은 호스트에 대한 연결 재사용 (keep-alive) 및 일시적 오류 재시도
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=32,
+                max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=sorted(RETRY_STATUSES),
+                                  allowed_methods=['GET'], respect_retry_after_header=True)
+            )
+            self.session.mount('https://', adapter)
+            self.session.mount('http://', adapter)
+            
+            # 로깅 설정 (Windows 유니코드 호환)
+            logging.basicConfig(
+                level=logging.INFO,
+                format='%(asctime)s - %(levelname)s - %(message)s',
+                handlers=[
+                    BufferedFileHandler('rex_research_crawler.log', encoding='utf-8'),
+                    logging.StreamHandler()
+                ]
+            )
         
-        # Windows 콘솔 인코딩 설정
-        import sys
-        if sys.platform == "win32":
-            try:
-                # UTF-8 콘솔 출력 설정 시도
-                import codecs
-                sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
-                sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
-            except:
-                # 실패 시 로그에서 이모지 제거 모드로 변경
-                self.use_emoji = False
-        else:
-            self.use_emoji = True
         self.logger = logging.getLogger(__name__)
         
+        # HTML 파서 (C 기반 lxml)
+        self._parser = 'lxml'
+        
         # 이모지 사용 여부 (Windows 호환성)
         self.use_emoji = True
         
-        # 데이터 저장용
-        self.inventions_data = []
+        # 수집한 발명품 요약 (열 단위 목록, 본문 등 전체 데이터는 파일/JSONL로 저장 후 메모리에서 해제)
+        self.inventions_index = {
+            'name': [],
+            'url': [],
+            'category': [],
+            'content_length': [],
+            'patent_count': [],
+            'image_count': [],
+        }
         self.visited_urls = set()
         self.request_delay = (1, 3)  # 1-3초 랜덤 지연
+        self.concurrency = 32  # 비동기 크롤링 시 동시 요청 수
+        self.max_content_chars = 0  # 페이지당 본문 최대 글자 수 (0이면 제한 없음)
+        self.parse_workers = 0  # 파싱 전용 프로세스 수 (0이면 스레드 풀에서 파싱)
+        self._parse_pool = None
+        self._writer_error = None  # 저장 스레드가 더 진행할 수 없는 오류로 멈춘 경우 그 예외
+        self.rate_limit = None  # 초당 최대 요청 수 (None이면 평균 지연으로 계산)
+        self._rate_limiter = None
         
         # 출력 디렉토리
         self.output_dir = "rex_inventions"
+        
+        # tar.gz 아카이브 저장 모드 (개별 .txt 파일 대신 하나의 아카이브)
+        self.archive = False
+        self.archive_path = None
+        
+        # 재시작(--resume)용 완료 URL 목록
+        self.completed_urls = set()
+        self.skip_existing = False  # 출력 .txt 파일이 이미 있는 발명품은 다시 받지 않음
+        
+        # 페이지 디스크 캐시 (--cache 지정 시 사용, 재실행 시 네트워크 요청 생략)
+        self.cache_dir = None
+        self.cache_ttl = 7 * 24 * 3600  # 7일
+    
+    def close(self):
+        """HTTP 세션 종료 (연결 풀 정리)"""
+        if self.session is not None:
+            self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    @property
+    def requests_per_second(self) -> Optional[float]:
+        """토큰 버킷에 적용할 초당 요청 수 (None이면 제한 없음)
+        
+        rate_limit을 지정하지 않으면 평균 지연마다 한 번(1 / 평균 지연), 즉 기존 순차 크롤러의
+        '요청마다 랜덤 지연'과 같은 보수적인 속도를 사용한다 (동시 요청 수와 무관, -r로 높일 수 있음).
+        """
+        if self.rate_limit:
+            return self.rate_limit
+        avg_delay = sum(self.request_delay) / 2
+        return 1 / avg_delay if avg_delay > 0 else None
     
     def _estimate_time(self, num_pages: int) -> int:
         """예상 소요시간 계산 (분 단위)"""
-        # 평균 지연시간 + 페이지 로드 시간 고려
-        avg_delay = sum(self.request_delay) / 2
+        # 요청 속도 제한 + 페이지 로드 시간 고려
         avg_processing_time = 2  # 페이지 처리 시간
-        total_seconds = num_pages * (avg_delay + avg_processing_time)
+        rate = self.requests_per_second
+        total_seconds = num_pages / rate if rate else 0
+        total_seconds += num_pages * avg_processing_time / self.concurrency
         return max(1, int(total_seconds / 60))
     
     def safe_log(self, level, message_with_emoji, message_plain):
@@ -82,6 +337,114 @@ class RexResearchCrawler:
             self.use_emoji = False
             getattr(self.logger, level)(message_plain)
         
+    @property
+    def completed_index_path(self) -> str:
+        """저장 완료된 URL을 기록하는 인덱스 파일 경로"""
+        return os.path.join(self.output_dir, 'completed.jsonl')
+    
+    @property
+    def inventions_jsonl_path(self) -> str:
+        """수집한 발명품 데이터를 한 줄에 하나씩 누적 기록하는 JSONL 파일 경로"""
+        return os.path.join(self.output_dir, 'inventions.jsonl')
+    
+    def load_completed_urls(self) -> set:
+        """완료 인덱스를 한 번에 읽어 저장 완료된 URL의 키(url_key) 집합 반환"""
+        completed = set()
+        if not os.path.exists(self.completed_index_path):
+            return completed
+        
+        with open(self.completed_index_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    completed.add(url_key(loads_json(line)['url']))
+                except (ValueError, KeyError):
+                    # 중단으로 잘린 마지막 줄 등은 무시
+                    continue
+        
+        self.safe_log('info', f"♻️ 완료 인덱스에서 {len(completed)}개 URL 로드", 
+                     f"[RESUME] 완료 인덱스에서 {len(completed)}개 URL 로드")
+        return completed
+    
+    def _cache_file(self, url: str) -> str:
+        """URL에 대응하는 캐시 파일 경로"""
+        digest = hashlib.sha1(canonical_url(url).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, digest + '.html')
+    
+    def read_cache(self, url: str) -> Optional[Tuple[bytes, Optional[str], Dict[str, str], bool]]:
+        """캐시 항목 반환: (본문 바이트, charset, 조건부 요청 헤더, 만료 전 여부) - 없으면 None
+        
+        만료된 항목도 ETag/Last-Modified가 있으면 If-None-Match/If-Modified-Since로 재검증할 수 있도록 반환한다.
+        """
+        if not self.cache_dir:
+            return None
+        
+        path = self._cache_file(url)
+        try:
+            fresh = time.time() - os.path.getmtime(path) <= self.cache_ttl
+            with open(path, 'rb') as f:
+                # 첫 줄은 "charset<TAB>ETag<TAB>Last-Modified" (없는 값은 빈 칸), 나머지는 원본 본문
+                header, _, body = f.read().partition(b'\n')
+        except OSError:
+            return None
+        
+        charset, etag, last_modified = (header.decode('ascii', 'ignore').split('\t') + ['', ''])[:3]
+        validators = {}
+        if etag:
+            validators['If-None-Match'] = etag
+        if last_modified:
+            validators['If-Modified-Since'] = last_modified
+        return body, charset or None, validators, fresh
+    
+    def write_cache(self, url: str, body: bytes, encoding: Optional[str], headers=None):
+        """가져온 본문을 캐시에 저장 (응답 헤더의 ETag/Last-Modified도 함께, 실패해도 크롤링은 계속)"""
+        if not self.cache_dir:
+            return
+        
+        etag = headers.get('ETag', '') if headers else ''
+        last_modified = headers.get('Last-Modified', '') if headers else ''
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # 임시 파일에 다 쓴 뒤 교체 - 중간에 중단되어도 잘린 본문이 캐시로 남지 않음
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with open(fd, 'wb') as f:
+                    f.write(f"{encoding or ''}\t{etag}\t{last_modified}\n".encode('ascii', 'ignore'))
+                    f.write(body)
+                os.replace(tmp_path, self._cache_file(url))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            self.safe_log('warning', f"⚠️ 캐시 저장 실패: {url} - {e}", f"[WARNING] 캐시 저장 실패: {url} - {e}")
+    
+    def _revalidated(self, url: str, cached: Tuple) -> Tuple[bytes, Optional[str]]:
+        """304 Not Modified 응답 시 캐시 만료 시각을 갱신하고 캐시 본문 반환
+        
+        변경이 없어도 파싱/저장은 건너뛰지 않는다 - 새 실행은 inventions.jsonl과 아카이브를 처음부터 다시 만들고,
+        --resume은 이미 저장된 발명품을 요청 전에 제외하므로 여기까지 온 페이지는 모두 다시 기록해야 한다.
+        """
+        try:
+            os.utime(self._cache_file(url))
+        except OSError:
+            pass
+        self.safe_log('info', f"♻️ 변경 없음 (캐시 사용): {url}", f"[CACHE] 변경 없음 (캐시 사용): {url}")
+        return cached[0], cached[1]
+    
+    def index_invention(self, invention_data: Dict):
+        """통계에 필요한 작은 값만 inventions_index에 추가"""
+        index = self.inventions_index
+        index['name'].append(invention_data['name'])
+        index['url'].append(invention_data['url'])
+        index['category'].append(invention_data.get('category', 'general'))
+        index['content_length'].append(len(invention_data.get('full_content', '')))
+        index['patent_count'].append(len(invention_data.get('patents', [])))
+        index['image_count'].append(len(invention_data.get('images', [])) + len(invention_data.get('diagrams', [])))
+    
+    @property
+    def collected_count(self) -> int:
+        """이번 실행에서 수집한 발명품 수"""
+        return len(self.inventions_index['url'])
+    
     def create_output_directory(self):
         """출력 디렉토리 생성"""
         if not os.path.exists(self.output_dir):
@@ -89,42 +452,147 @@ class RexResearchCrawler:
             self.safe_log('info', f"📁 출력 디렉토리 생성: {self.output_dir}", 
                          f"[CREATE] 출력 디렉토리 생성: {self.output_dir}")
         
-    def get_page(self, url: str, retries: int = 3) -> Optional[BeautifulSoup]:
-        """페이지를 가져오고 BeautifulSoup 객체로 반환"""
-        for attempt in range(retries):
-            try:
-                time.sleep(random.uniform(*self.request_delay))
-                
-                response = self.session.get(url, timeout=15)
+    @staticmethod
+    def _declared_charset(content_type: str) -> Optional[str]:
+        """Content-Type 헤더에 명시된 charset (없으면 None - 파서가 meta 태그 등으로 판별)"""
+        for param in content_type.split(';')[1:]:
+            key, _, value = param.partition('=')
+            if key.strip().lower() == 'charset':
+                return value.strip().strip('"\'') or None
+        return None
+    
+    @staticmethod
+    def _is_html(content_type: str) -> bool:
+        """HTML로 파싱할 응답인지 (헤더가 없으면 HTML로 간주, PDF/이미지 등은 제외)"""
+        media_type = content_type.split(';', 1)[0].strip().lower()
+        return not media_type or 'html' in media_type or 'xml' in media_type
+    
+    def parse_html(self, body: bytes, encoding: Optional[str] = None,
+                   parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """응답 바이트를 그대로 파서에 전달 (인코딩 판별과 디코딩은 lxml이 처리)"""
+        return BeautifulSoup(body, self._parser, from_encoding=encoding, parse_only=parse_only)
+    
+    def get_page(self, url: str, parse_only: Optional[SoupStrainer] = None) -> Optional[BeautifulSoup]:
+        """페이지를 가져오고 BeautifulSoup 객체로 반환 (parse_only 지정 시 해당 태그만 생성)
+        
+        연결 오류, 타임아웃, 429/5xx 재시도는 세션 어댑터의 Retry가 처리하고 그 외 4xx는 바로 실패한다.
+        """
+        cached = self.read_cache(url)
+        if cached and cached[3]:
+            # 캐시 적중 시 요청 지연 없이 바로 파싱
+            return self.parse_html(cached[0], cached[1], parse_only)
+        
+        try:
+            # 본문을 문자열로 만들지 않고 스트림에서 바로 파싱 (만료된 캐시는 조건부 요청으로 재검증)
+            with self.session.get(url, timeout=15, stream=True, headers=cached[2] if cached else None) as response:
+                if response.status_code == 304 and cached:
+                    return self.parse_html(*self._revalidated(url, cached), parse_only)
                 response.raise_for_status()
                 
-                # 인코딩 처리
-                if response.encoding is None:
-                    response.encoding = 'utf-8'
-                elif response.encoding.lower() in ['iso-8859-1', 'windows-1252']:
-                    response.encoding = 'utf-8'
+                # PDF/이미지 등은 본문을 받지 않고 바로 건너뜀
+                content_type = response.headers.get('Content-Type', '')
+                if not self._is_html(content_type):
+                    self.safe_log('warning', f"⚠️ HTML이 아닌 응답 건너뜀: {url} ({content_type})",
+                                f"[SKIP] HTML이 아닌 응답 건너뜀: {url} ({content_type})")
+                    return None
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
+                response.raw.decode_content = True
+                encoding = self._declared_charset(content_type)
+                if self.cache_dir:
+                    body = response.raw.read()
+                    self.write_cache(url, body, encoding, response.headers)
+                    soup = self.parse_html(body, encoding, parse_only)
+                else:
+                    soup = self.parse_html(response.raw, encoding, parse_only)
+            
+        except requests.RequestException as e:
+            self.safe_log('error', f"❌ 페이지 로드 실패: {url} - {e}", f"[ERROR] 페이지 로드 실패: {url} - {e}")
+            return None
+        
+        self.safe_log('info', f"✅ 페이지 로드 성공: {url}", f"[SUCCESS] 페이지 로드 성공: {url}")
+        return soup
+
+    def get_index_page(self, url: Optional[str] = None) -> Optional[BeautifulSoup]:
+        """목차(인덱스) 페이지 로드 - 링크 추출에 필요한 <a href> 태그만 파싱"""
+        return self.get_page(url or self.base_url, parse_only=INDEX_STRAINER)
+    
+    @staticmethod
+    def _retry_after(headers) -> Optional[float]:
+        """Retry-After 헤더의 대기 초 (초 단위 숫자만 지원, 없거나 해석 불가하면 None)"""
+        value = headers.get('Retry-After') if headers else None
+        try:
+            return max(0.0, float(value)) if value else None
+        except ValueError:
+            return None
+    
+    async def fetch_page_async(self, session: aiohttp.ClientSession, sem: asyncio.Semaphore,
+                               url: str, retries: int = 3) -> Optional[Tuple[bytes, Optional[str]]]:
+        """페이지 본문을 비동기로 가져오기 (세마포어로 동시 요청 수 제한)
+        
+        본문은 디코딩하지 않은 바이트와 헤더에 명시된 charset 쌍으로 반환하며 파서가 직접 디코딩한다.
+        """
+        # 캐시 파일 입출력은 이벤트 루프를 막지 않도록 스레드 풀에서 실행
+        loop = asyncio.get_running_loop()
+        cached = await loop.run_in_executor(None, self.read_cache, url) if self.cache_dir else None
+        if cached and cached[3]:
+            return cached[0], cached[1]
+        
+        for attempt in range(retries):
+            try:
+                async with sem:
+                    if self._rate_limiter is not None:
+                        await self._rate_limiter.acquire()
+
+                    # 만료된 캐시는 조건부 요청으로 재검증 (변경 없으면 304로 본문 없이 응답)
+                    async with session.get(url, timeout=aiohttp.ClientTimeout(total=15),
+                                           headers=cached[2] if cached else None) as response:
+                        if response.status == 304 and cached:
+                            return await loop.run_in_executor(None, self._revalidated, url, cached)
+                        response.raise_for_status()
+
+                        # PDF/이미지 등은 본문을 받지 않고 바로 건너뜀
+                        content_type = response.headers.get('Content-Type', '')
+                        if not self._is_html(content_type):
+                            self.safe_log('warning', f"⚠️ HTML이 아닌 응답 건너뜀: {url} ({content_type})",
+                                        f"[SKIP] HTML이 아닌 응답 건너뜀: {url} ({content_type})")
+                            return None
+
+                        encoding = response.charset
+                        body = await response.read()
+                        validators = response.headers
+
+                if self.cache_dir:
+                    await loop.run_in_executor(None, self.write_cache, url, body, encoding, validators)
+
                 self.safe_log('info', f"✅ 페이지 로드 성공: {url}", f"[SUCCESS] 페이지 로드 성공: {url}")
-                return soup
-                
-            except requests.RequestException as e:
-                self.safe_log('warning', f"⚠️ 페이지 로드 실패 (시도 {attempt + 1}/{retries}): {url} - {e}", 
+                return body, encoding
+
+            except aiohttp.ClientResponseError as e:
+                # 404/403 등 일시적이지 않은 오류는 재시도해도 같으므로 바로 포기
+                if e.status not in RETRY_STATUSES:
+                    self.safe_log('error', f"❌ 페이지 로드 실패 (재시도 안 함): {url} - {e.status}",
+                                f"[ERROR] 페이지 로드 실패 (재시도 안 함): {url} - {e.status}")
+                    return None
+                self.safe_log('warning', f"⚠️ 페이지 로드 실패 (시도 {attempt + 1}/{retries}): {url} - {e.status}",
+                            f"[WARNING] 페이지 로드 실패 (시도 {attempt + 1}/{retries}): {url} - {e.status}")
+                if attempt < retries - 1:
+                    await asyncio.sleep(self._retry_after(e.headers) or 2 ** attempt)
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.safe_log('warning', f"⚠️ 페이지 로드 실패 (시도 {attempt + 1}/{retries}): {url} - {e}",
                             f"[WARNING] 페이지 로드 실패 (시도 {attempt + 1}/{retries}): {url} - {e}")
                 if attempt < retries - 1:
-                    time.sleep(2 ** attempt)
-                    
+                    await asyncio.sleep(2 ** attempt)
+
         self.safe_log('error', f"❌ 모든 시도 실패: {url}", f"[ERROR] 모든 시도 실패: {url}")
         return None
-    
+
     def extract_invention_links(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
-        """메인 페이지에서 발명품/발명자 링크들을 추출"""
-        invention_links = []
+        """메인 페이지에서 발명품/발명자 링크들을 추출 (정규화 URL 기준으로 중복 제거하며 한 번에 수집)"""
+        unique = {}
         
         # 모든 링크 찾기
-        links = soup.find_all('a', href=True)
-        
-        for link in links:
+        for link in soup.find_all('a', href=True):
             href = link.get('href', '').strip()
             text = link.get_text(strip=True)
             
@@ -133,22 +601,19 @@ class RexResearchCrawler:
                 
             # 발명품/발명자 링크인지 판단
             if self.is_invention_link(href, text):
-                full_url = urljoin(self.base_domain, href)
+                full_url = join_url(self.base_domain, href)
+                key = url_key(full_url)
+                if key in unique:
+                    continue
                 
-                invention_links.append({
+                unique[key] = {
                     'name': text,
                     'url': full_url,
                     'href': href,
                     'category': self.get_link_category(text)
-                })
+                }
         
-        # 중복 제거
-        seen_urls = set()
-        unique_links = []
-        for link in invention_links:
-            if link['url'] not in seen_urls:
-                seen_urls.add(link['url'])
-                unique_links.append(link)
+        unique_links = list(unique.values())
         
         self.safe_log('info', f"📋 총 {len(unique_links)}개의 발명품 링크 발견", 
                      f"[INFO] 총 {len(unique_links)}개의 발명품 링크 발견")
@@ -156,30 +621,9 @@ class RexResearchCrawler:
     
     def is_invention_link(self, href: str, text: str) -> bool:
         """링크가 발명품/발명자 관련인지 판단"""
-        href_lower = href.lower()
-        text_lower = text.lower()
-        
-        # 제외할 패턴들
-        exclude_patterns = [
-            'javascript:', 'mailto:', '#', 'http://', 'https://',
-            'index.html', 'home.html', 'about.html', 'contact.html',
-            'search.html', 'links.html', 'disclaimer.html'
-        ]
-        
-        exclude_texts = [
-            'home', 'back', 'top', 'index', 'search', 'contact',
-            'about', 'links', 'disclaimer', 'rexresearch',
-            'inventor index', 'subject index'
-        ]
-        
-        # 제외 패턴 체크
-        for pattern in exclude_patterns:
-            if pattern in href_lower:
-                return False
-        
-        for pattern in exclude_texts:
-            if pattern in text_lower:
-                return False
+        # 제외 패턴 체크 (미리 컴파일된 정규식으로 한 번에 검사)
+        if _EXCLUDE_HREF_RE.search(href) or _EXCLUDE_TEXT_RE.search(text):
+            return False
         
         # 유효한 링크 조건
         return (
@@ -193,21 +637,16 @@ class RexResearchCrawler:
     
     def get_link_category(self, text: str) -> str:
         """링크의 카테고리 추정"""
-        text_lower = text.lower()
-        
         # 에너지 관련
-        energy_keywords = ['energy', 'power', 'electric', 'magnetic', 'battery', 'fuel', 'solar', 'generator']
-        if any(keyword in text_lower for keyword in energy_keywords):
+        if _ENERGY_RE.search(text):
             return 'energy'
         
         # 의료 관련
-        medical_keywords = ['medical', 'health', 'therapy', 'healing', 'cure', 'treatment']
-        if any(keyword in text_lower for keyword in medical_keywords):
+        if _MEDICAL_RE.search(text):
             return 'medical'
         
         # 교통 관련
-        transport_keywords = ['car', 'vehicle', 'engine', 'motor', 'aviation', 'aircraft']
-        if any(keyword in text_lower for keyword in transport_keywords):
+        if _TRANSPORT_RE.search(text):
             return 'transport'
         
         return 'general'
@@ -217,17 +656,12 @@ class RexResearchCrawler:
         if not text:
             return ""
         
-        # HTML 엔티티 처리
-        text = text.replace('&nbsp;', ' ')
-        text = text.replace('&amp;', '&')
-        text = text.replace('&lt;', '<')
-        text = text.replace('&gt;', '>')
-        text = text.replace('&quot;', '"')
-        text = text.replace('&apos;', "'")
+        # HTML 엔티티 처리 (이름/숫자 엔티티 모두, &nbsp;는 아래 공백 정리에서 공백으로)
+        if '&' in text:
+            text = unescape(text)
         
-        # 여러 공백과 줄바꿈 정리
-        text = re.sub(r'\s+', ' ', text)
-        text = re.sub(r'\n\s*\n', '\n\n', text)
+        # 여러 공백과 줄바꿈을 공백 하나로 정리
+        text = _WS_RE.sub(' ', text)
         
         return text.strip()
     
@@ -250,34 +684,37 @@ class RexResearchCrawler:
         }
         
         try:
+            # 필요한 태그와 본문 문자열을 한 번의 순회로 수집
+            nodes = self._scan_page(soup)
+            
             # 페이지 제목
-            title_tag = soup.find('title')
+            title_tag = nodes['title']
             if title_tag:
-                invention_data['title'] = self.clean_text(title_tag.get_text())
+                invention_data['title'] = intern_text(self.clean_text(title_tag.get_text()))
             
             # 메타 설명
-            meta_desc = soup.find('meta', {'name': 'description'})
+            meta_desc = nodes['meta_description']
             if meta_desc:
                 invention_data['meta_description'] = meta_desc.get('content', '')
             
-            # 본문 텍스트 추출
-            full_text = soup.get_text(separator='\n', strip=True)
+            # 본문 텍스트 (soup.get_text(separator='\n', strip=True)와 동일)
+            full_text = nodes['full_text']
             invention_data['full_content'] = self.clean_text(full_text)
             
             # 구조화된 섹션 추출
-            self.extract_structured_sections(soup, invention_data)
+            self.extract_structured_sections(nodes['headings'], nodes['paragraphs'], invention_data)
             
             # 이미지 및 다이어그램 추출
-            self.extract_images_and_diagrams(soup, url, invention_data)
+            self.extract_images_and_diagrams(nodes['images'], url, invention_data)
             
             # 특허 정보 추출
             self.extract_patent_info(full_text, invention_data)
             
             # 참조 링크 추출
-            self.extract_references(soup, invention_data)
+            self.extract_references(nodes['links'], invention_data)
             
             # 기술적 원리 추출
-            self.extract_technical_principle(soup, invention_data)
+            self.extract_technical_principle(invention_data)
             
         except Exception as e:
             self.safe_log('error', f"❌ 컨텐츠 추출 중 오류: {url} - {e}", 
@@ -285,28 +722,86 @@ class RexResearchCrawler:
         
         return invention_data
     
-    def extract_structured_sections(self, soup: BeautifulSoup, invention_data: Dict):
+    def _scan_page(self, soup: BeautifulSoup) -> Dict:
+        """페이지 트리를 한 번만 순회하며 추출에 필요한 태그와 본문 문자열을 종류별로 수집
+        
+        태그 목록은 find_all(limit=...)과 같은 문서 순서/개수 상한을 따르고,
+        full_text는 soup.get_text(separator='\n', strip=True)와 같다 (max_content_chars 지정 시 그 길이까지).
+        """
+        nodes = {
+            'title': None,
+            'meta_description': None,
+            'headings': [],
+            'paragraphs': [],
+            'images': [],
+            'links': [],
+        }
+        headings = nodes['headings']
+        paragraphs = nodes['paragraphs']
+        images = nodes['images']
+        links = nodes['links']
+        
+        # get_text와 같은 종류의 문자열만 (주석, script/style 내용 등 제외)
+        string_types = getattr(soup, 'interesting_string_types', None) or {NavigableString, CData}
+        text_limit = self.max_content_chars
+        strings = []
+        text_length = -1  # 구분자 길이 포함, 첫 문자열 앞에는 구분자가 없음
+        
+        for node in soup.descendants:
+            if isinstance(node, NavigableString):
+                if type(node) in string_types and (not text_limit or text_length < text_limit):
+                    stripped = node.strip()
+                    if stripped:
+                        strings.append(stripped)
+                        text_length += len(stripped) + 1
+                continue
+            
+            name = node.name
+            if name == 'p':
+                paragraphs.append(node)
+            elif name == 'a':
+                if len(links) < self.MAX_LINKS_PER_PAGE and node.get('href') is not None:
+                    links.append(node)
+            elif name in _HEADING_TAGS:
+                if len(headings) < self.MAX_HEADINGS_PER_PAGE:
+                    headings.append(node)
+            elif name == 'img':
+                if len(images) < self.MAX_IMAGES_PER_PAGE:
+                    images.append(node)
+            elif name == 'title':
+                if nodes['title'] is None:
+                    nodes['title'] = node
+            elif name == 'meta':
+                if nodes['meta_description'] is None and node.get('name') == 'description':
+                    nodes['meta_description'] = node
+        
+        full_text = '\n'.join(strings)
+        nodes['full_text'] = full_text[:text_limit] if text_limit else full_text
+        return nodes
+    
+    def extract_structured_sections(self, headings: List, paragraphs: List, invention_data: Dict):
         """구조화된 섹션 추출"""
         sections = {}
         
-        # 헤딩으로 섹션 구분
-        headings = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+        # 문단 텍스트는 한 번만 만들어 섹션 내용과 주요 문단에 함께 사용
+        paragraph_texts = {id(p): self.clean_text(p.get_text()) for p in paragraphs}
         
+        # 헤딩으로 섹션 구분
         for heading in headings:
             heading_text = self.clean_text(heading.get_text())
             if heading_text:
-                # 헤딩 다음의 컨텐츠 추출
+                # 헤딩 다음 형제 노드를 다음 헤딩 직전까지 한 번만 순회
+                # (같은 부모 아래 헤딩들은 형제 구간을 나눠 가지므로 전체 순회는 노드 수에 비례)
                 content = []
-                current = heading.next_sibling
-                
-                while current and current.name not in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
+                for current in heading.next_siblings:
+                    if current.name in _HEADING_TAGS:
+                        break
                     if hasattr(current, 'get_text'):
-                        text = self.clean_text(current.get_text())
-                        if text and len(text) > 10:
+                        text = paragraph_texts.get(id(current))
+                        if text is None:
+                            text = self.clean_text(current.get_text())
+                        if len(text) > 10:
                             content.append(text)
-                    current = current.next_sibling
-                    if not current:
-                        break
                 
                 if content:
                     sections[heading_text] = content
@@ -314,33 +809,27 @@ class RexResearchCrawler:
         invention_data['structured_sections'] = sections
         
         # 주요 문단들 추출
-        paragraphs = soup.find_all('p')
-        tech_details = []
-        for p in paragraphs:
-            text = self.clean_text(p.get_text())
-            if text and len(text) > 50:  # 의미있는 길이의 문단만
-                tech_details.append(text)
-        
-        invention_data['technical_details'] = tech_details
+        invention_data['technical_details'] = [
+            text for text in paragraph_texts.values() if len(text) > 50  # 의미있는 길이의 문단만
+        ]
     
-    def extract_images_and_diagrams(self, soup: BeautifulSoup, base_url: str, invention_data: Dict):
+    def extract_images_and_diagrams(self, images: List, base_url: str, invention_data: Dict):
         """이미지 및 다이어그램 정보 추출"""
-        images = soup.find_all('img')
-        
         for img in images:
             src = img.get('src', '')
             alt = img.get('alt', '')
             title = img.get('title', '')
             
             if src:
-                full_img_url = urljoin(base_url, src)
-                filename = os.path.basename(src)
+                full_img_url = join_url(base_url, src)
+                filename = intern_text(os.path.basename(src))
                 
+                # 로고/버튼 이미지는 여러 페이지에 반복되므로 문자열 공유
                 img_info = {
-                    'url': full_img_url,
+                    'url': intern_text(full_img_url),
                     'filename': filename,
-                    'alt_text': self.clean_text(alt),
-                    'title': self.clean_text(title),
+                    'alt_text': intern_text(self.clean_text(alt)),
+                    'title': intern_text(self.clean_text(title)),
                     'type': self.classify_image_type(filename, alt)
                 }
                 
@@ -351,41 +840,25 @@ class RexResearchCrawler:
     
     def classify_image_type(self, filename: str, alt_text: str) -> str:
         """이미지 타입 분류"""
-        filename_lower = filename.lower()
-        alt_lower = alt_text.lower()
-        
-        diagram_keywords = ['diagram', 'schematic', 'circuit', 'blueprint', 'plan', 'design']
-        photo_keywords = ['photo', 'picture', 'image']
-        
-        if any(keyword in filename_lower or keyword in alt_lower for keyword in diagram_keywords):
+        if _DIAGRAM_RE.search(filename) or _DIAGRAM_RE.search(alt_text):
             return 'diagram'
-        elif any(keyword in filename_lower or keyword in alt_lower for keyword in photo_keywords):
+        elif _PHOTO_RE.search(filename) or _PHOTO_RE.search(alt_text):
             return 'photo'
         else:
             return 'image'
     
     def extract_patent_info(self, text: str, invention_data: Dict):
         """특허 정보 추출"""
-        patent_patterns = [
-            r'(?:US\s*)?Patent\s+(?:No\.?\s*)?(\d{1,2}[,.\s]?\d{3}[,.\s]?\d{3})',
-            r'U\.S\.\s*Patent\s+(\d{1,2}[,.\s]?\d{3}[,.\s]?\d{3})',
-            r'Patent\s+#\s*(\d{1,2}[,.\s]?\d{3}[,.\s]?\d{3})',
-            r'Pat\.\s*No\.\s*(\d{1,2}[,.\s]?\d{3}[,.\s]?\d{3})'
-        ]
-        
         patents = set()
-        for pattern in patent_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                clean_patent = re.sub(r'[,.\s]', '', match)
-                if len(clean_patent) >= 6:  # 유효한 특허 번호 길이
-                    patents.add(clean_patent)
+        for match in _PATENT_RE.findall(text):
+            clean_patent = _PATENT_SEPARATOR_RE.sub('', match)
+            if len(clean_patent) >= 6:  # 유효한 특허 번호 길이
+                patents.add(clean_patent)
         
         invention_data['patents'] = list(patents)
     
-    def extract_references(self, soup: BeautifulSoup, invention_data: Dict):
-        """참조 링크 추출"""
-        links = soup.find_all('a', href=True)
+    def extract_references(self, links: List, invention_data: Dict):
+        """참조 링크 추출 (MAX_LINKS_PER_PAGE개 링크까지만 검사)"""
         references = []
         
         for link in links:
@@ -394,165 +867,178 @@ class RexResearchCrawler:
             
             if href and text and href.startswith('http'):
                 references.append({
-                    'url': href,
-                    'text': text
+                    'url': intern_text(href),
+                    'text': intern_text(text)
                 })
         
         invention_data['references'] = references
     
-    def extract_technical_principle(self, soup: BeautifulSoup, invention_data: Dict):
-        """기술적 원리 및 설명 추출"""
-        # 전체 텍스트에서 원리 관련 부분 찾기
-        full_text = invention_data['full_content']
-        
-        # 원리 관련 키워드로 섹션 찾기
-        principle_keywords = [
-            'principle', 'theory', 'mechanism', 'operation', 'working',
-            'function', 'process', 'method', 'technique', 'approach'
-        ]
-        
-        # 문단별로 분석하여 원리 설명 추출
+    def extract_technical_principle(self, invention_data: Dict):
+        """기술적 원리 및 설명 추출 (이미 정리된 technical_details 문단 재사용)"""
+        # 문단별로 원리 관련 키워드(_PRINCIPLE_RE)를 찾아 원리 설명 추출
         paragraphs = invention_data['technical_details']
         principle_paragraphs = []
         
         for paragraph in paragraphs:
-            paragraph_lower = paragraph.lower()
-            if any(keyword in paragraph_lower for keyword in principle_keywords):
+            if _PRINCIPLE_RE.search(paragraph):
                 principle_paragraphs.append(paragraph)
+                # 처음 3개 문단만 사용하므로 찾으면 나머지는 검사하지 않음
+                if len(principle_paragraphs) == 3:
+                    break
         
         if principle_paragraphs:
-            invention_data['principle'] = '\n\n'.join(principle_paragraphs[:3])  # 처음 3개 문단
+            invention_data['principle'] = '\n\n'.join(principle_paragraphs)  # 처음 3개 문단
         else:
             # 원리 설명이 없으면 첫 번째 의미있는 문단을 설명으로
             if paragraphs:
                 invention_data['description'] = paragraphs[0]
     
-    def save_invention_file(self, invention_data: Dict) -> str:
-        """개별 발명품 파일 저장 (LLM 학습용 형식)"""
-        # 안전한 파일명 생성
-        name = invention_data.get('name', 'unknown')
-        safe_name = re.sub(r'[^\w\s-]', '', name).strip()
-        safe_name = re.sub(r'[-\s]+', '_', safe_name)
+    def get_invention_filename(self, invention_data: Dict) -> str:
+        """발명품 이름으로 안전한 파일명 생성"""
+        return self._filename_for(invention_data.get('name', 'unknown'))
+    
+    def _target_path(self, name: str) -> str:
+        """발명품 이름에 대응하는 출력 .txt 파일 경로"""
+        return os.path.join(self.output_dir, self._filename_for(name))
+    
+    @staticmethod
+    def _filename_for(name: str) -> str:
+        """이름을 파일명으로 쓸 수 있게 정리"""
+        safe_name = _FILENAME_UNSAFE_RE.sub('', name).strip()
+        safe_name = _FILENAME_SEPARATOR_RE.sub('_', safe_name)
         safe_name = safe_name[:100]  # 파일명 길이 제한
         
-        filename = f"{safe_name}.txt"
-        filepath = os.path.join(self.output_dir, filename)
+        return f"{safe_name}.txt"
+    
+    def format_invention_content(self, invention_data: Dict) -> str:
+        """발명품 내용을 LLM 학습용 형식의 문자열로 생성 (조각을 모아 한 번에 join)"""
+        parts = []
+        append = parts.append
+        
+        # LLM 학습용 구조화된 형식
+        append("=" * 80 + "\n")
+        append(f"INVENTION: {invention_data.get('name', 'Unknown')}\n")
+        append("=" * 80 + "\n\n")
+        
+        # 기본 정보
+        append("BASIC INFORMATION:\n")
+        append("-" * 40 + "\n")
+        append(f"Title: {invention_data.get('title', 'N/A')}\n")
+        append(f"URL: {invention_data.get('url', 'N/A')}\n")
+        append(f"Extraction Date: {invention_data.get('extracted_at', 'N/A')}\n\n")
+        
+        # 특허 정보
+        patents = invention_data.get('patents', [])
+        if patents:
+            append("PATENT INFORMATION:\n")
+            append("-" * 40 + "\n")
+            for patent in patents:
+                append(f"Patent Number: {patent}\n")
+            append("\n")
+        
+        # 기술적 원리
+        principle = invention_data.get('principle', '')
+        if principle:
+            append("TECHNICAL PRINCIPLE:\n")
+            append("-" * 40 + "\n")
+            append(f"{principle}\n\n")
+        
+        # 상세 설명
+        description = invention_data.get('description', '')
+        if description:
+            append("DESCRIPTION:\n")
+            append("-" * 40 + "\n")
+            append(f"{description}\n\n")
+        
+        # 기술적 세부사항
+        tech_details = invention_data.get('technical_details', [])
+        if tech_details:
+            append("TECHNICAL DETAILS:\n")
+            append("-" * 40 + "\n")
+            for i, detail in enumerate(tech_details[:5], 1):  # 처음 5개만
+                append(f"{i}. {detail}\n\n")
+        
+        # 구조화된 섹션들
+        sections = invention_data.get('structured_sections', {})
+        if sections:
+            append("STRUCTURED SECTIONS:\n")
+            append("-" * 40 + "\n")
+            for section_title, content_list in sections.items():
+                append(f"\n[{section_title}]\n")
+                for content in content_list[:3]:  # 각 섹션당 3개까지
+                    append(f"{content}\n")
+            append("\n")
+        
+        # 이미지 및 다이어그램 정보
+        images = invention_data.get('images', [])
+        diagrams = invention_data.get('diagrams', [])
+        
+        if images or diagrams:
+            append("VISUAL MATERIALS:\n")
+            append("-" * 40 + "\n")
+            
+            if diagrams:
+                append("Diagrams and Schematics:\n")
+                for i, diag in enumerate(diagrams, 1):
+                    append(f"{i}. File: {diag['filename']}\n")
+                    append(f"   URL: {diag['url']}\n")
+                    if diag['alt_text']:
+                        append(f"   Description: {diag['alt_text']}\n")
+                    if diag['title']:
+                        append(f"   Title: {diag['title']}\n")
+                    append("\n")
+            
+            if images:
+                append("Images and Photos:\n")
+                for i, img in enumerate(images, 1):
+                    append(f"{i}. File: {img['filename']}\n")
+                    append(f"   URL: {img['url']}\n")
+                    if img['alt_text']:
+                        append(f"   Description: {img['alt_text']}\n")
+                    if img['title']:
+                        append(f"   Title: {img['title']}\n")
+                    append("\n")
+        
+        # 참조 자료
+        references = invention_data.get('references', [])
+        if references:
+            append("REFERENCES:\n")
+            append("-" * 40 + "\n")
+            for i, ref in enumerate(references[:10], 1):  # 처음 10개만
+                append(f"{i}. {ref['text']}\n")
+                append(f"   URL: {ref['url']}\n\n")
+        
+        # 전체 컨텐츠 (LLM 학습용)
+        append("FULL CONTENT FOR AI TRAINING:\n")
+        append("-" * 40 + "\n")
+        append(invention_data.get('full_content', ''))
+        append("\n\n")
+        
+        # 메타데이터 (JSON 형식)
+        append("METADATA (JSON):\n")
+        append("-" * 40 + "\n")
+        metadata = {
+            'name': invention_data.get('name'),
+            'title': invention_data.get('title'),
+            'url': invention_data.get('url'),
+            'patents': invention_data.get('patents'),
+            'image_count': len(invention_data.get('images', [])),
+            'diagram_count': len(invention_data.get('diagrams', [])),
+            'reference_count': len(invention_data.get('references', [])),
+            'extracted_at': invention_data.get('extracted_at')
+        }
+        append(dumps_json(metadata))
+        
+        return ''.join(parts)
+    
+    def save_invention_file(self, invention_data: Dict) -> str:
+        """개별 발명품 파일 저장 (LLM 학습용 형식)"""
+        filepath = self._target_path(invention_data.get('name', 'unknown'))
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                # LLM 학습용 구조화된 형식
-                f.write("=" * 80 + "\n")
-                f.write(f"INVENTION: {invention_data.get('name', 'Unknown')}\n")
-                f.write("=" * 80 + "\n\n")
-                
-                # 기본 정보
-                f.write("BASIC INFORMATION:\n")
-                f.write("-" * 40 + "\n")
-                f.write(f"Title: {invention_data.get('title', 'N/A')}\n")
-                f.write(f"URL: {invention_data.get('url', 'N/A')}\n")
-                f.write(f"Extraction Date: {invention_data.get('extracted_at', 'N/A')}\n\n")
-                
-                # 특허 정보
-                patents = invention_data.get('patents', [])
-                if patents:
-                    f.write("PATENT INFORMATION:\n")
-                    f.write("-" * 40 + "\n")
-                    for patent in patents:
-                        f.write(f"Patent Number: {patent}\n")
-                    f.write("\n")
-                
-                # 기술적 원리
-                principle = invention_data.get('principle', '')
-                if principle:
-                    f.write("TECHNICAL PRINCIPLE:\n")
-                    f.write("-" * 40 + "\n")
-                    f.write(f"{principle}\n\n")
-                
-                # 상세 설명
-                description = invention_data.get('description', '')
-                if description:
-                    f.write("DESCRIPTION:\n")
-                    f.write("-" * 40 + "\n")
-                    f.write(f"{description}\n\n")
-                
-                # 기술적 세부사항
-                tech_details = invention_data.get('technical_details', [])
-                if tech_details:
-                    f.write("TECHNICAL DETAILS:\n")
-                    f.write("-" * 40 + "\n")
-                    for i, detail in enumerate(tech_details[:5], 1):  # 처음 5개만
-                        f.write(f"{i}. {detail}\n\n")
-                
-                # 구조화된 섹션들
-                sections = invention_data.get('structured_sections', {})
-                if sections:
-                    f.write("STRUCTURED SECTIONS:\n")
-                    f.write("-" * 40 + "\n")
-                    for section_title, content_list in sections.items():
-                        f.write(f"\n[{section_title}]\n")
-                        for content in content_list[:3]:  # 각 섹션당 3개까지
-                            f.write(f"{content}\n")
-                    f.write("\n")
-                
-                # 이미지 및 다이어그램 정보
-                images = invention_data.get('images', [])
-                diagrams = invention_data.get('diagrams', [])
-                
-                if images or diagrams:
-                    f.write("VISUAL MATERIALS:\n")
-                    f.write("-" * 40 + "\n")
-                    
-                    if diagrams:
-                        f.write("Diagrams and Schematics:\n")
-                        for i, diag in enumerate(diagrams, 1):
-                            f.write(f"{i}. File: {diag['filename']}\n")
-                            f.write(f"   URL: {diag['url']}\n")
-                            if diag['alt_text']:
-                                f.write(f"   Description: {diag['alt_text']}\n")
-                            if diag['title']:
-                                f.write(f"   Title: {diag['title']}\n")
-                            f.write("\n")
-                    
-                    if images:
-                        f.write("Images and Photos:\n")
-                        for i, img in enumerate(images, 1):
-                            f.write(f"{i}. File: {img['filename']}\n")
-                            f.write(f"   URL: {img['url']}\n")
-                            if img['alt_text']:
-                                f.write(f"   Description: {img['alt_text']}\n")
-                            if img['title']:
-                                f.write(f"   Title: {img['title']}\n")
-                            f.write("\n")
-                
-                # 참조 자료
-                references = invention_data.get('references', [])
-                if references:
-                    f.write("REFERENCES:\n")
-                    f.write("-" * 40 + "\n")
-                    for i, ref in enumerate(references[:10], 1):  # 처음 10개만
-                        f.write(f"{i}. {ref['text']}\n")
-                        f.write(f"   URL: {ref['url']}\n\n")
-                
-                # 전체 컨텐츠 (LLM 학습용)
-                f.write("FULL CONTENT FOR AI TRAINING:\n")
-                f.write("-" * 40 + "\n")
-                f.write(invention_data.get('full_content', ''))
-                f.write("\n\n")
-                
-                # 메타데이터 (JSON 형식)
-                f.write("METADATA (JSON):\n")
-                f.write("-" * 40 + "\n")
-                metadata = {
-                    'name': invention_data.get('name'),
-                    'title': invention_data.get('title'),
-                    'url': invention_data.get('url'),
-                    'patents': invention_data.get('patents'),
-                    'image_count': len(invention_data.get('images', [])),
-                    'diagram_count': len(invention_data.get('diagrams', [])),
-                    'reference_count': len(invention_data.get('references', [])),
-                    'extracted_at': invention_data.get('extracted_at')
-                }
-                f.write(json.dumps(metadata, indent=2, ensure_ascii=False))
+            content = self.format_invention_content(invention_data)
+            with open(filepath, 'w', encoding='utf-8', buffering=262144) as f:
+                f.write(content)
             
             self.safe_log('info', f"💾 파일 저장 완료: {filepath}", f"[SAVE] 파일 저장 완료: {filepath}")
             return filepath
@@ -562,35 +1048,28 @@ class RexResearchCrawler:
                          f"[ERROR] 파일 저장 실패: {filepath} - {e}")
             return None
     
-    def crawl_invention_page(self, invention_info: Dict) -> Optional[Dict]:
-        """개별 발명품 페이지 크롤링"""
-        url = invention_info['url']
-        name = invention_info['name']
-        
-        if url in self.visited_urls:
-            return None
+    def add_invention_to_archive(self, tar: tarfile.TarFile, invention_data: Dict) -> Optional[str]:
+        """발명품 파일을 tar.gz 아카이브 멤버로 추가"""
+        member_name = f"{os.path.basename(os.path.normpath(self.output_dir))}/{self.get_invention_filename(invention_data)}"
         
-        self.visited_urls.add(url)
-        
-        soup = self.get_page(url)
-        if not soup:
+        try:
+            data = self.format_invention_content(invention_data).encode('utf-8')
+            
+            info = tarfile.TarInfo(member_name)
+            info.size = len(data)
+            info.mtime = int(time.time())
+            tar.addfile(info, io.BytesIO(data))
+            
+            self.safe_log('info', f"💾 아카이브 추가 완료: {member_name}", f"[SAVE] 아카이브 추가 완료: {member_name}")
+            return member_name
+            
+        except Exception as e:
+            self.safe_log('error', f"❌ 아카이브 추가 실패: {member_name} - {e}", 
+                         f"[ERROR] 아카이브 추가 실패: {member_name} - {e}")
             return None
-        
-        invention_data = self.extract_invention_content(soup, url, name)
-        invention_data['category'] = invention_info.get('category', 'general')
-        
-        return invention_data
     
-    def run_crawler(self, max_pages: int = 0):
-        """크롤링 실행"""
-        self.safe_log('info', f"🚀 Rex Research 크롤링 시작: {self.base_url}", 
-                     f"[START] Rex Research 크롤링 시작: {self.base_url}")
-        
-        # 출력 디렉토리 생성
-        self.create_output_directory()
-        
-        # 메인 페이지 로드
-        main_soup = self.get_page(self.base_url)
+    def _prepare_invention_links(self, main_soup: Optional[BeautifulSoup], max_pages: int) -> Optional[List[Dict]]:
+        """메인 페이지에서 크롤링할 발명품 링크 목록 준비"""
         if not main_soup:
             self.safe_log('error', "❌ 메인 페이지 로드 실패", "[ERROR] 메인 페이지 로드 실패")
             return None
@@ -602,6 +1081,23 @@ class RexResearchCrawler:
             self.safe_log('warning', "⚠️ 발명품 링크를 찾을 수 없습니다", "[WARNING] 발명품 링크를 찾을 수 없습니다")
             return None
         
+        # 재시작 모드: 이미 저장된 링크 제외
+        if self.completed_urls:
+            before = len(invention_links)
+            invention_links = [link for link in invention_links
+                               if url_key(link['url']) not in self.completed_urls]
+            self.safe_log('info', f"⏭️ 이미 저장된 {before - len(invention_links)}개 발명품 건너뜀", 
+                         f"[SKIP] 이미 저장된 {before - len(invention_links)}개 발명품 건너뜀")
+        
+        # 출력 파일이 이미 있는 링크 제외 (완료 인덱스가 없는 이전 결과도 이어받기, 디렉토리 목록 한 번만 조회)
+        if self.skip_existing and not self.archive and os.path.isdir(self.output_dir):
+            existing = set(os.listdir(self.output_dir))
+            before = len(invention_links)
+            invention_links = [link for link in invention_links
+                               if self._filename_for(link['name']) not in existing]
+            self.safe_log('info', f"⏭️ 파일이 이미 있는 {before - len(invention_links)}개 발명품 건너뜀", 
+                         f"[SKIP] 파일이 이미 있는 {before - len(invention_links)}개 발명품 건너뜀")
+        
         # 전체 링크 수 로그
         total_found = len(invention_links)
         self.safe_log('info', f"📊 총 {total_found}개의 발명품 링크 발견!", 
@@ -618,82 +1114,250 @@ class RexResearchCrawler:
         
         self.safe_log('info', f"🚀 크롤링 시작 - 예상 소요시간: {self._estimate_time(len(invention_links))}분", 
                      f"[START] 크롤링 시작 - 예상 소요시간: {self._estimate_time(len(invention_links))}분")
-        
-        saved_files = []
-        success_count = 0
-        
-        # 각 발명품 페이지 크롤링
-        for i, invention_info in enumerate(invention_links, 1):
-            clean_name = invention_info['name'][:50].replace('\n', ' ').strip()
-            self.safe_log('info', f"🔄 진행상황: {i}/{len(invention_links)} - {clean_name}", 
-                         f"[PROGRESS] {i}/{len(invention_links)} - {clean_name}")
-            
-            try:
-                invention_data = self.crawl_invention_page(invention_info)
-                if invention_data:
-                    self.inventions_data.append(invention_data)
-                    
-                    # 개별 파일 저장
-                    saved_file = self.save_invention_file(invention_data)
-                    if saved_file:
-                        saved_files.append(saved_file)
-                        success_count += 1
-                    
-            except KeyboardInterrupt:
-                self.safe_log('info', "⏹️ 사용자가 중단했습니다", "[STOP] 사용자가 중단했습니다")
-                break
-            except Exception as e:
-                self.safe_log('error', f"❌ 크롤링 중 오류: {invention_info['name']} - {e}", 
-                             f"[ERROR] 크롤링 중 오류: {invention_info['name']} - {e}")
-                continue
-        
-        # 최종 결과
+        return invention_links
+    
+    def _build_result(self, invention_links: List[Dict], saved_files: List[str], success_count: int) -> Dict:
+        """최종 결과 정리"""
         result = {
             'total_links': len(invention_links),
             'successful_crawls': success_count,
             'saved_files': saved_files,
             'output_directory': self.output_dir,
+            'archive_path': self.archive_path,
+            'data_path': self.inventions_jsonl_path,
             'failed_count': len(invention_links) - success_count
         }
         
         self.safe_log('info', f"✅ 크롤링 완료! 성공: {success_count}/{len(invention_links)}", 
                      f"[COMPLETE] 크롤링 완료! 성공: {success_count}/{len(invention_links)}")
         return result
+    
+    def run_crawler(self, max_pages: int = 0):
+        """크롤링 실행 (동기 호출용 - 내부적으로 run_crawler_async 실행)"""
+        try:
+            return asyncio.run(self.run_crawler_async(max_pages=max_pages))
+        except KeyboardInterrupt:
+            self.safe_log('info', "⏹️ 사용자가 중단했습니다", "[STOP] 사용자가 중단했습니다")
+            return None
+    
+    def _parse_invention(self, body: bytes, encoding: Optional[str], url: str, name: str) -> Dict:
+        """HTML 파싱 및 컨텐츠 추출 (이벤트 루프 밖 스레드에서 실행)"""
+        soup = self.parse_html(body, encoding)
+        return self.extract_invention_content(soup, url, name)
+    
+    async def crawl_invention_page_async(self, session: aiohttp.ClientSession, sem: asyncio.Semaphore,
+                                         invention_info: Dict) -> Optional[Dict]:
+        """개별 발명품 페이지 비동기 크롤링"""
+        url = invention_info['url']
+        name = invention_info['name']
+        
+        key = url_key(url)
+        if key in self.visited_urls:
+            return None
+        
+        self.visited_urls.add(key)
+        
+        page = await self.fetch_page_async(session, sem, url)
+        if not page:
+            return None
+        body, encoding = page
+        
+        # 파싱은 CPU 작업이므로 이벤트 루프를 막지 않도록 프로세스 풀(지정 시) 또는 스레드 풀에서 실행
+        loop = asyncio.get_running_loop()
+        if self._parse_pool is not None:
+            invention_data = await loop.run_in_executor(self._parse_pool, parse_invention_page, body, encoding, url, name)
+        else:
+            invention_data = await loop.run_in_executor(None, self._parse_invention, body, encoding, url, name)
+        invention_data['category'] = invention_info.get('category', 'general')
+        
+        return invention_data
+    
+    async def run_crawler_async(self, max_pages: int = 0):
+        """비동기 크롤링 실행 (aiohttp + 세마포어로 동시 요청)"""
+        self.safe_log('info', f"🚀 Rex Research 비동기 크롤링 시작: {self.base_url} (동시 요청: {self.concurrency})", 
+                     f"[START] Rex Research 비동기 크롤링 시작: {self.base_url} (동시 요청: {self.concurrency})")
+        
+        # 출력 디렉토리 생성
+        self.create_output_directory()
+        
+        sem = asyncio.BoundedSemaphore(self.concurrency)
+        # 요청마다 고정 지연 대신 토큰 버킷으로 평균 속도만 제한 (유휴 대기 제거)
+        rate = self.requests_per_second
+        self._rate_limiter = AsyncRateLimiter(rate, burst=rate) if rate else None
+        # 요청 사이 지연(request_delay)보다 keep-alive를 길게 유지해 TCP/TLS 연결 재사용
+        connector = aiohttp.TCPConnector(
+            limit=64,
+            limit_per_host=8,
+            ttl_dns_cache=300,
+            keepalive_timeout=max(30.0, self.request_delay[1] * 4)
+        )
+        
+        async with aiohttp.ClientSession(connector=connector, headers=DEFAULT_HEADERS) as session:
+            # 메인 페이지 로드 및 링크 준비
+            main_page = await self.fetch_page_async(session, sem, self.base_url)
+            main_soup = self.parse_html(*main_page, parse_only=INDEX_STRAINER) if main_page else None
+            invention_links = self._prepare_invention_links(main_soup, max_pages)
+            if invention_links is None:
+                return None
+            
+            saved_files = []
+            completed = 0
+            total = len(invention_links)
+            
+            if self.archive:
+                self.archive_path = f"{os.path.normpath(self.output_dir)}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.tar.gz"
+            
+            async def crawl_one(invention_info: Dict):
+                nonlocal completed
+                try:
+                    invention_data = await self.crawl_invention_page_async(session, sem, invention_info)
+                    if invention_data:
+                        self.index_invention(invention_data)
+                        write_queue.put(invention_data)
+                except Exception as e:
+                    self.safe_log('error', f"❌ 크롤링 중 오류: {invention_info['name']} - {e}", 
+                                 f"[ERROR] 크롤링 중 오류: {invention_info['name']} - {e}")
+                
+                completed += 1
+                clean_name = invention_info['name'][:50].replace('\n', ' ').strip()
+                self.safe_log('info', f"🔄 진행상황: {completed}/{total} - {clean_name}", 
+                             f"[PROGRESS] {completed}/{total} - {clean_name}")
+            
+            # 파싱을 여러 CPU 코어에 분산 (GIL 회피, spawn으로 스레드 상태를 복제하지 않음)
+            if self.parse_workers > 0:
+                self._parse_pool = ProcessPoolExecutor(
+                    max_workers=self.parse_workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_parse_worker,
+                    initargs=(self.max_content_chars,)
+                )
+            
+            # 각 발명품 페이지 동시 크롤링 (중단 시에도 대기 중인 파일은 모두 저장)
+            crawl = asyncio.gather(*(crawl_one(info) for info in invention_links))
+            
+            # 파일 저장은 전용 writer 스레드가 큐에서 꺼내 순차 처리
+            # (저장 스레드가 멈추면 더 받아도 저장할 수 없으므로 남은 크롤링을 취소)
+            loop = asyncio.get_running_loop()
+            self._writer_error = None
+            write_queue = queue.Queue()
+            writer = threading.Thread(target=self._writer_thread,
+                                      args=(write_queue, saved_files, lambda: loop.call_soon_threadsafe(crawl.cancel)),
+                                      daemon=True)
+            writer.start()
+            
+            try:
+                await crawl
+            except asyncio.CancelledError:
+                if self._writer_error is None:
+                    raise
+                self.safe_log('error', f"❌ 저장 스레드 오류로 크롤링 중단: {self._writer_error}", 
+                             f"[ERROR] 저장 스레드 오류로 크롤링 중단: {self._writer_error}")
+            finally:
+                if self._parse_pool is not None:
+                    self._parse_pool.shutdown(cancel_futures=True)
+                    self._parse_pool = None
+                write_queue.put(None)
+                writer.join()
+        
+        if self._writer_error is not None:
+            return None
+        return self._build_result(invention_links, saved_files, len(saved_files))
+    
+    def _writer_thread(self, write_queue: queue.Queue, saved_files: List[str], abort: Callable[[], None]):
+        """큐에 쌓인 발명품 데이터를 파일로 저장 (None을 받으면 종료)
+        
+        항목별 저장 실패는 로그만 남기고 계속하며, 출력 파일을 열 수 없는 등 더 진행할 수 없으면
+        _writer_error에 예외를 기록하고 abort()로 크롤링 중단을 요청한다.
+        """
+        # 전체 데이터 JSONL은 이어받기(--resume) 중일 때만 이어 쓰고, 새 실행에서는 덮어씀 (중복 레코드 방지)
+        data_mode = 'a' if self.skip_existing else 'w'
+        try:
+            with (tarfile.open(self.archive_path, 'w:gz', compresslevel=1) if self.archive else nullcontext()) as tar, \
+                 open(self.completed_index_path, 'a', encoding='utf-8', buffering=131072) as index, \
+                 open(self.inventions_jsonl_path, data_mode, encoding='utf-8', buffering=131072) as data_file:
+                while (invention_data := write_queue.get()) is not None:
+                    try:
+                        # 전체 데이터는 받는 즉시 JSONL로 누적 기록 (중단되어도 앞부분은 보존)
+                        # 기록에 실패해도(직렬화 오류, 디스크 부족 등) 개별 파일 저장은 계속
+                        try:
+                            data_file.write(dumps_json_line(invention_data) + '\n')
+                        except Exception as e:
+                            self.safe_log('error', f"❌ 전체 데이터 기록 실패: {invention_data.get('name', 'unknown')} - {e}", 
+                                         f"[ERROR] 전체 데이터 기록 실패: {invention_data.get('name', 'unknown')} - {e}")
+                        
+                        if tar is not None:
+                            saved_file = self.add_invention_to_archive(tar, invention_data)
+                        else:
+                            saved_file = self.save_invention_file(invention_data)
+                        if saved_file:
+                            saved_files.append(saved_file)
+                            # 저장 완료 기록 (--resume 시 건너뛰기용)
+                            index.write(dumps_json_line({'url': invention_data['url'], 'path': saved_file}) + '\n')
+                    except Exception as e:
+                        self.safe_log('error', f"❌ 저장 실패: {invention_data.get('name', 'unknown')} - {e}", 
+                                     f"[ERROR] 저장 실패: {invention_data.get('name', 'unknown')} - {e}")
+        except Exception as e:
+            self._writer_error = e
+            self.safe_log('error', f"❌ 저장 스레드 중단: {e}", f"[ERROR] 저장 스레드 중단: {e}")
+            abort()
+
+# 프로세스 풀 워커마다 하나씩 만드는 파싱 전용 크롤러
+_worker_crawler = None
+
+def _init_parse_worker(max_content_chars: int):
+    """파싱 워커 프로세스 초기화 (로그 파일은 메인 프로세스만 기록하고 워커는 콘솔로만 출력)"""
+    global _worker_crawler
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[logging.StreamHandler()]
+    )
+    _worker_crawler = RexResearchCrawler(parse_only=True)
+    _worker_crawler.max_content_chars = max_content_chars
+
+def parse_invention_page(body: bytes, encoding: Optional[str], url: str, name: str) -> Dict:
+    """워커 프로세스에서 발명품 페이지 파싱 (ProcessPoolExecutor에 넘기기 위한 모듈 수준 함수)"""
+    return _worker_crawler._parse_invention(body, encoding, url, name)
 
 # 사용 예시
 if __name__ == "__main__":
-    crawler = RexResearchCrawler()
+    from cli import build_parser, apply_args, configure_console
+    configure_console()
+    parser = build_parser()
+    args = parser.parse_args()
+    
+    # 링크 확인(--dry-run)과 카테고리별 링크 목록(--category)은 main.py에서만 지원
+    if args.dry_run or args.category:
+        parser.error("--dry-run/--category는 main.py에서 사용하세요 (python main.py --dry-run)")
+    
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+    
+    crawler = RexResearchCrawler(base_url=args.url)
+    apply_args(crawler, args)
     
-    safe_print("🕷️ Rex Research 발명품 크롤러 시작", "Rex Research 발명품 크롤러 시작")
-    safe_print("전체 발명품 크롤링을 시작합니다...")
-    safe_print("⚠️ 대용량 크롤링입니다. 중단 시 Ctrl+C를 누르세요")
+    print("🕷️ Rex Research 발명품 크롤러 시작")
+    print("전체 발명품 크롤링을 시작합니다...")
+    print("⚠️ 대용량 크롤링입니다. 중단 시 Ctrl+C를 누르세요")
     
-    result = crawler.run_crawler(max_pages=0)  # 전체 크롤링
+    result = crawler.run_crawler(max_pages=5 if args.test else args.max_pages)  # 기본값 0 = 전체 크롤링
     
     if result:
-        safe_print(f"\n✅ 크롤링 결과:", "\n[RESULTS] 크롤링 결과:")
-        safe_print(f"   - 총 링크 수: {result['total_links']}")
-        safe_print(f"   - 성공적 크롤링: {result['successful_crawls']}")
-        safe_print(f"   - 실패 수: {result['failed_count']}")
-        safe_print(f"   - 저장된 파일: {len(result['saved_files'])}개")
-        safe_print(f"   - 출력 디렉토리: {result['output_directory']}/")
+        print(f"\n✅ 크롤링 결과:")
+        print(f"   - 총 링크 수: {result['total_links']}")
+        print(f"   - 성공적 크롤링: {result['successful_crawls']}")
+        print(f"   - 실패 수: {result['failed_count']}")
+        print(f"   - 저장된 파일: {len(result['saved_files'])}개")
+        print(f"   - 출력 디렉토리: {result['output_directory']}/")
         
         # 카테고리별 통계
-        if crawler.inventions_data:
+        if crawler.collected_count:
             categories = {}
-            for invention in crawler.inventions_data:
-                cat = invention.get('category', 'general')
+            for cat in crawler.inventions_index['category']:
                 categories[cat] = categories.get(cat, 0) + 1
             
-            safe_print(f"\n📊 카테고리별 통계:", "\n[CATEGORY STATS] 카테고리별 통계:")
+            print(f"\n📊 카테고리별 통계:")
             for cat, count in categories.items():
-                safe_print(f"   - {cat}: {count}개")
+                print(f"   - {cat}: {count}개")
     else:
-        safe_print("❌ 크롤링에 실패했습니다.", "[ERROR] 크롤링에 실패했습니다.")
-
-def safe_print(message_with_emoji, message_plain=""):
-    """안전한 출력 (Windows 유니코드 호환)"""
-    try:
-        print(message_with_emoji)
-    except UnicodeEncodeError:
-        print(message_plain if message_plain else message_with_emoji.encode('ascii', 'ignore').decode('ascii'))
\ No newline at end of file
+        print("❌ 크롤링에 실패했습니다.")